@@ -13,12 +13,41 @@ bl_info = {
 import bpy
 import bmesh
 import math
-import random
+import os
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from mathutils import Vector
+from mathutils.bvhtree import BVHTree
 from bpy.props import IntProperty, FloatProperty, EnumProperty, BoolProperty
 from bpy.types import Operator, Panel, PropertyGroup
 from bpy.utils import register_class, unregister_class
 
+# Numba isn't bundled with Blender, the NumPy code paths are used without it
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Open3D's raycasting scene casts whole batches through Embree on every core
+try:
+    import open3d
+except ImportError:
+    open3d = None
+
+# trimesh is only used when Embree is available, otherwise rays go through mathutils' BVHTree
+try:
+    import trimesh
+    import trimesh.ray
+    if not trimesh.ray.has_embree:
+        trimesh = None
+except ImportError:
+    trimesh = None
+
+
+# Rays stop this far short of both ends so they never hit the surface they start or end on
+RAY_EPSILON = 0.001
+
 
 def get_or_create_camera_collection():
     """
@@ -33,51 +62,85 @@ def get_or_create_camera_collection():
     return cam_collection
 
 
-def create_camera_ring(row_angle, camera_heights, radius, collection, prefix="Camera"):
+def create_camera(name, location, radius, collection, camera_type='PERSP'):
+    """
+    Create a camera at the location on the camera sphere, pointing at its center
+    """
+    cam_data = bpy.data.cameras.new(name=name)
+    cam_data.type = camera_type
+    if camera_type == 'ORTHO':
+        # Wide enough to frame everything inside the camera sphere
+        cam_data.ortho_scale = radius * 2
+    cam_obj = bpy.data.objects.new(name, cam_data)
+    
+    # Add camera to the collection instead of scene collection
+    collection.objects.link(cam_obj)
+    
+    # Position camera
+    cam_obj.location = location
+    
+    # Point camera to center (0,0,0)
+    direction = cam_obj.location
+    cam_obj.rotation_euler = direction.to_track_quat('Z', 'Y').to_euler()
+    return cam_obj
+
+
+def create_camera_ring(row_angle, camera_heights, radius, collection, prefix="Camera", camera_type='PERSP'):
     """
     Create cameras along a vertical spline at specified row angle
     """
+    # Calculate every position on the sphere at once, the row angle is shared by the ring
+    height_rads = np.radians(camera_heights)
+    row_rad = math.radians(row_angle)
+    horizontal_radii = radius * np.cos(height_rads)
+    positions = np.column_stack((
+        horizontal_radii * math.cos(row_rad),
+        horizontal_radii * math.sin(row_rad),
+        radius * np.sin(height_rads),
+    )).tolist()
+
     cameras = []
-    for i, height_angle in enumerate(camera_heights):
-        # Convert angles to radians
-        height_rad = math.radians(height_angle)
-        row_rad = math.radians(row_angle)
-        
-        # Calculate position on sphere
-        height = radius * math.sin(height_rad)
-        horizontal_radius = radius * math.cos(height_rad)
-        x = horizontal_radius * math.cos(row_rad)
-        y = horizontal_radius * math.sin(row_rad)
-        z = height
-        
-        # Create camera
+    for i, location in enumerate(positions):
         temp_name = f"{prefix}.Row{row_angle:.0f}.{i+1}"
-        cam_data = bpy.data.cameras.new(name=temp_name)
-        cam_obj = bpy.data.objects.new(temp_name, cam_data)
-        
-        # Add camera to the collection instead of scene collection
-        collection.objects.link(cam_obj)
-        
-        # Position camera
-        cam_obj.location = (x, y, z)
-        
-        # Point camera to center (0,0,0)
-        direction = cam_obj.location
-        cam_obj.rotation_euler = direction.to_track_quat('Z', 'Y').to_euler()
-        
-        cameras.append(cam_obj)
+        cameras.append(create_camera(temp_name, location, radius, collection, camera_type))
     return cameras
 
 
-def create_camera_setup(rows=4, cameras_per_row=4, sphere_radius=10, keep_cameras=False):
+def create_camera_sphere(count, radius, collection, prefix="Camera", camera_type='PERSP'):
+    """
+    Create cameras at uniformly distributed random points on a sphere, using Marsaglia's method
+    """
+    # Draw points in the unit disk by rejection, each maps to a uniform point on the sphere
+    rng = np.random.default_rng()
+    disk = np.zeros((0, 2))
+    while len(disk) < count:
+        candidates = rng.uniform(-1.0, 1.0, (count * 2, 2))
+        disk = np.concatenate((disk, candidates[np.einsum('ij,ij->i', candidates, candidates) < 1.0]))
+    u, v = disk[:count].T
+    s = u * u + v * v
+    scale = 2 * np.sqrt(1 - s)
+    positions = (np.column_stack((u * scale, v * scale, 1 - 2 * s)) * radius).tolist()
+
+    return [
+        create_camera(f"{prefix}.Sphere.{i+1}", location, radius, collection, camera_type)
+        for i, location in enumerate(positions)
+    ]
+
+
+def create_camera_setup(rows=4, cameras_per_row=4, sphere_radius=10, keep_cameras=False, camera_type='PERSP',
+                        distribution='RINGS'):
     """
-    Create cameras arranged in vertical splines around a sphere
+    Create cameras arranged in vertical splines around a sphere, or spread uniformly over it
     """
     # Determine which collection to use
     if keep_cameras:
         collection = get_or_create_camera_collection()
     else:
         collection = bpy.context.scene.collection
+
+    # Uniform cameras don't bunch up towards the poles like the splines do
+    if distribution == 'UNIFORM':
+        return create_camera_sphere(rows * cameras_per_row, sphere_radius, collection, camera_type=camera_type)
     
     # Calculate angles between rows
     row_angle_step = 360.0 / rows
@@ -96,109 +159,811 @@ def create_camera_setup(rows=4, cameras_per_row=4, sphere_radius=10, keep_camera
     all_cameras = []
     for i in range(rows):
         row_angle = i * row_angle_step
-        row_cameras = create_camera_ring(row_angle, height_angles, sphere_radius, collection)
+        row_cameras = create_camera_ring(row_angle, height_angles, sphere_radius, collection, camera_type=camera_type)
         all_cameras.extend(row_cameras)
     
     return all_cameras
 
 
-def are_faces_similar(face1, face2, max_angle_diff):
+def are_faces_similar(normals1, normals2, min_cos):
     """
-    Check if two faces are similar based on their normal angle
+    Check if faces are similar based on their normals, given the cosine of the largest angle allowed between them
     """
-    angle = abs(face1.normal.angle(face2.normal))
-    return math.degrees(angle) <= max_angle_diff
+    # The cosine falls as the angle grows, so comparing it avoids computing the angle
+    return (normals1 * normals2).sum(axis=-1) >= min_cos
 
 
-def select_visible_faces_multi_cameras(obj, cameras, precision, experimental, sampling_ratio, flatness_angle):
-    bpy.ops.object.mode_set(mode='OBJECT')
-    scene = bpy.context.scene
+def similar_linked_faces(face_indices, face_links, normals, min_cos):
+    """
+    Get the indices of the faces sharing a vertex with any of the faces that are similar to the face they are linked from
+    """
+    # Every linked pair of the given faces is compared in one pass
+    starts, sizes, linked = face_links
+    sources, positions = expand_ranges(face_indices, starts, sizes)
+    linked = linked[positions]
+    return np.unique(linked[are_faces_similar(normals[linked], normals[sources], min_cos)])
+
+
+def get_world_space_geometry(obj, edge_midpoints=True):
+    """
+    Get world-space vertex positions, face centers, face normals and edge midpoints as NumPy arrays.
+    Edge midpoints are None unless asked for
+    """
     mesh = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.faces.ensure_lookup_table()
+    # Single precision is plenty for ray casting against a millimeter tolerance and halves the memory traffic
+    matrix = np.array(obj.matrix_world, dtype=np.float32)
+    rotation = matrix[:3, :3].T
+    translation = matrix[:3, 3]
+
+    # Buffers match Blender's float storage, so foreach_get copies them in one block
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    verts_world = co.reshape(-1, 3) @ rotation + translation
 
-    for face in bm.faces:
-        face.select = False
+    centers = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("center", centers)
+    centers = centers.reshape(-1, 3) @ rotation + translation
+
+    # Normals transform by the inverse transpose so non-uniform scale keeps them perpendicular
+    normals = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    normals = normals.reshape(-1, 3) @ np.linalg.inv(matrix[:3, :3])
+    normals /= np.maximum(np.linalg.norm(normals, axis=1), 1e-12)[:, np.newaxis]
+
+    if not edge_midpoints:
+        return verts_world, centers, normals, None
+
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    edge_verts = edge_verts.reshape(-1, 2)
+    edge_mids = (verts_world[edge_verts[:, 0]] + verts_world[edge_verts[:, 1]]) * 0.5
+
+    return verts_world, centers, normals, edge_mids
+
+
+def get_face_loop_indices(mesh):
+    """
+    Get the per-face vertex and edge indices of a mesh as flat arrays with face offsets
+    """
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    return loop_starts, loop_totals, loop_verts, loop_edges
+
+
+def expand_ranges(indices, starts, sizes):
+    """
+    Get the flat positions covered by the ranges of the given indices, along with the index each position belongs to
+    """
+    sizes = sizes[indices]
+    owners = np.repeat(indices, sizes)
+    offsets = np.arange(len(owners)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    return owners, np.repeat(starts[indices], sizes) + offsets
+
+
+def invert_face_elements(loop_elements, loop_faces, element_count):
+    """
+    Invert the per-loop vertex or edge indices into the faces using each element.
+    Returns the faces grouped by element with every element's start and size
+    """
+    order = np.argsort(loop_elements, kind='stable')
+    sizes = np.bincount(loop_elements, minlength=element_count)
+    return np.cumsum(sizes) - sizes, sizes, loop_faces[order]
+
+
+def link_faces(loop_starts, loop_totals, loop_verts, vert_faces):
+    """
+    Get the faces sharing at least one vertex with each face, excluding the face itself.
+    Returns the linked faces grouped by face with every face's start and size
+    """
+    face_count = len(loop_starts)
+    owners, loops = expand_ranges(np.arange(face_count), loop_starts, loop_totals)
+    verts = loop_verts[loops]
+    vert_starts, vert_sizes, faces = vert_faces
+    pair_loops, positions = expand_ranges(np.arange(len(verts)), vert_starts[verts], vert_sizes[verts])
+    pairs = np.unique(owners[pair_loops].astype(np.int64) * face_count + faces[positions])
+    sources, linked = pairs // face_count, pairs % face_count
+    keep = sources != linked
+    sizes = np.bincount(sources[keep], minlength=face_count)
+    return np.cumsum(sizes) - sizes, sizes, linked[keep]
+
+
+def get_loop_triangles(mesh):
+    """
+    Get Blender's triangulation of the faces, returning the triangle vertex indices and the face each triangle belongs to
+    """
+    # Unlike a plain fan, Blender's tessellation stays inside concave n-gons
+    mesh.calc_loop_triangles()
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    triangle_faces = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+    mesh.loop_triangles.foreach_get("polygon_index", triangle_faces)
+    return triangles.reshape(-1, 3), triangle_faces
+
+
+def get_camera_arrays(cameras):
+    """
+    Get the locations, view directions, half field of view cosines, image plane axes and
+    orthographic half sizes of the cameras as NumPy arrays. The half size is 0 for perspective cameras
+    """
+    # Vectors match the single precision of the geometry, so per-camera math doesn't upcast it
+    cam_locations = np.array(
+        [camera.matrix_world.translation[:] for camera in cameras], dtype=np.float32
+    ).reshape(-1, 3)
+    rotations = [camera.matrix_world.to_quaternion() for camera in cameras]
+    cam_directions = np.array(
+        [(rotation @ Vector((0.0, 0.0, -1.0)))[:] for rotation in rotations], dtype=np.float32
+    ).reshape(-1, 3)
+    cam_axes = np.array([
+        ((rotation @ Vector((1.0, 0.0, 0.0)))[:], (rotation @ Vector((0.0, 1.0, 0.0)))[:]) for rotation in rotations
+    ], dtype=np.float32).reshape(-1, 2, 3)
+    cam_fovs = np.array([
+        camera.data.angle if camera.data.type == 'PERSP' else math.radians(90.0) for camera in cameras
+    ])
+    # The square covers the view rectangle whichever side ortho_scale spans
+    ortho_half_sizes = np.array([
+        camera.data.ortho_scale * 0.5 if camera.data.type == 'ORTHO' else 0.0 for camera in cameras
+    ])
+    return cam_locations, cam_directions, np.cos(cam_fovs * 0.5), cam_axes, ortho_half_sizes
+
+
+def points_in_fov(points, cam_location, cam_direction, cos_half_fov):
+    """
+    Return a boolean mask of the points that lie inside the camera's view cone
+    """
+    # Comparing squares avoids the square root, which holds since camera FOVs are below 180 degrees
+    vec = points - cam_location
+    dot = vec @ cam_direction
+    return (dot > 0) & (dot * dot > cos_half_fov * cos_half_fov * np.einsum('ij,ij->i', vec, vec))
+
+
+def points_in_ortho_view(points, cam_location, cam_direction, cam_axes, half_size):
+    """
+    Return a boolean mask of the points that lie in front of an orthographic camera and inside its view rectangle
+    """
+    vec = points - cam_location
+    return (vec @ cam_direction > 0) & (np.abs(vec @ cam_axes.T) < half_size).all(axis=1)
+
+
+def bin_faces(centers, face_radii, faces_per_cell=64):
+    """
+    Sort the faces into a coarse grid of cells and get a bounding sphere for each cell.
+    Returns the faces in cell order with every cell's start, size, center and radius in that order
+    """
+    if not len(centers):
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, np.zeros((0, 3)), np.zeros(0)
+
+    low = centers.min(axis=0)
+    extent = np.maximum(centers.max(axis=0) - low, 1e-9)
+    resolution = int(np.clip(np.ceil(np.cbrt(len(centers) / faces_per_cell)), 1, 32))
+    cell_coords = np.minimum(((centers - low) / extent * resolution).astype(np.int64), resolution - 1)
+    cell_ids = (cell_coords[:, 0] * resolution + cell_coords[:, 1]) * resolution + cell_coords[:, 2]
+
+    order = np.argsort(cell_ids, kind='stable')
+    cells, cell_starts, cell_sizes = np.unique(cell_ids[order], return_index=True, return_counts=True)
+    cell_coords = np.column_stack((cells // (resolution * resolution), cells // resolution % resolution, cells % resolution))
+    cell_centers = low + (cell_coords + 0.5) * extent / resolution
+
+    # Each sphere encloses every sample point of the faces in its cell, not only their centers
+    reach = np.linalg.norm(centers[order] - np.repeat(cell_centers, cell_sizes, axis=0), axis=1) + face_radii[order]
+    cell_radii = np.maximum.reduceat(reach, cell_starts)
+    return order, cell_starts, cell_sizes, cell_centers, cell_radii
+
+
+def cells_in_view(cell_centers, cell_radii, cam_location, cam_direction, cos_half_fov):
+    """
+    Return a boolean mask of the cells whose bounding sphere reaches into the camera's view cone
+    """
+    # The sphere reaches into the cone when its center is within the half FOV plus the sphere's angular
+    # radius of the axis. Expanding the cosine of that sum compares without any inverse trig
+    vec = cell_centers - cam_location
+    dist_sq = np.einsum('ij,ij->i', vec, vec)
+    radii_sq = cell_radii * cell_radii
+    sin_half_fov = math.sqrt(max(1.0 - cos_half_fov * cos_half_fov, 0.0))
+    reach = cos_half_fov * np.sqrt(np.maximum(dist_sq - radii_sq, 0.0)) - sin_half_fov * cell_radii
+    return (dist_sq <= radii_sq) | (vec @ cam_direction >= reach)
+
+
+def cells_in_ortho_view(cell_centers, cell_radii, cam_location, cam_direction, cam_axes, half_size):
+    """
+    Return a boolean mask of the cells whose bounding sphere reaches into an orthographic camera's view box
+    """
+    vec = cell_centers - cam_location
+    in_front = vec @ cam_direction > -cell_radii
+    return in_front & (np.abs(vec @ cam_axes.T) < (half_size + cell_radii)[:, np.newaxis]).all(axis=1)
+
+
+def segment_rays(cam_location, points):
+    """
+    Get the origins, directions and lengths of rays from the camera that stop just short of the points
+    """
+    directions = points - cam_location
+    distances = np.sqrt(np.einsum('ij,ij->i', directions, directions))
+    directions /= np.maximum(distances, RAY_EPSILON)[:, np.newaxis]
+    return cam_location + RAY_EPSILON * directions, directions, distances - 2 * RAY_EPSILON
+
+
+def ortho_segment_rays(cam_location, cam_direction, points):
+    """
+    Get the origins, directions and lengths of rays along an orthographic camera's view direction
+    that start on its image plane and stop just short of the points
+    """
+    # Every ray shares the view direction, so nothing is normalized per point
+    depths = (points - cam_location) @ cam_direction
+    origins = points - (depths - RAY_EPSILON)[:, np.newaxis] * cam_direction
+    return origins, np.tile(cam_direction, (len(points), 1)), depths - 2 * RAY_EPSILON
+
+
+def morton_order(points):
+    """
+    Get the order that sorts the points along a Morton curve through their bounding box, so neighbors stay close
+    """
+    if len(points) < 2:
+        return np.arange(len(points))
+    low = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - low, 1e-12)
+    # Quantize to 10 bits per axis and spread each bit two places apart, so the axes interleave into one key
+    cells = ((points - low) / extent * 1023).astype(np.uint32)
+    cells = (cells | (cells << 16)) & 0x030000FF
+    cells = (cells | (cells << 8)) & 0x0300F00F
+    cells = (cells | (cells << 4)) & 0x030C30C3
+    cells = (cells | (cells << 2)) & 0x09249249
+    return np.argsort(cells[:, 0] | (cells[:, 1] << 1) | (cells[:, 2] << 2), kind='stable')
+
+
+def can_launch_numba():
+    """
+    Check if a parallel Numba kernel may be launched from the current thread.
+    Numba's default threading layer aborts when kernels are launched from two threads at once,
+    and keeps the interpreter from exiting when its pool is first started from a worker thread
+    """
+    return njit is not None and threading.current_thread() is threading.main_thread()
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _build_bvh_jit(tri_min, tri_max, leaf_size, padding):
+        count = tri_min.shape[0]
+        centroids = (tri_min + tri_max) * 0.5
+        order = np.arange(count)
+        max_nodes = max(2 * count - 1, 1)
+        node_min = np.empty((max_nodes, 3))
+        node_max = np.empty((max_nodes, 3))
+        node_child = np.full(max_nodes, -1, dtype=np.int64)
+        node_start = np.zeros(max_nodes, dtype=np.int64)
+        node_count = np.zeros(max_nodes, dtype=np.int64)
+        node_count[0] = count
+        used = 1
+        stack = np.empty(max_nodes, dtype=np.int64)
+        stack[0] = 0
+        top = 1
+        while top > 0:
+            top -= 1
+            node = stack[top]
+            start = node_start[node]
+            end = start + node_count[node]
+            members = order[start:end].copy()
+            # Bounds are padded past the intersection tolerance, so a ray grazing an edge that lies
+            # in an axis plane still reaches the triangles it is accepted by
+            for axis in range(3):
+                node_min[node, axis] = tri_min[members, axis].min() - padding
+                node_max[node, axis] = tri_max[members, axis].max() + padding
+            if end - start <= leaf_size:
+                continue
+
+            # Split at the median along the longest axis of the triangle centroids
+            split_axis = 0
+            widest = -1.0
+            for axis in range(3):
+                width = centroids[members, axis].max() - centroids[members, axis].min()
+                if width > widest:
+                    widest = width
+                    split_axis = axis
+            order[start:end] = members[np.argsort(centroids[members, split_axis])]
+            mid = start + (end - start) // 2
+            left = used
+            used += 2
+            node_child[node] = left
+            node_start[left] = start
+            node_count[left] = mid - start
+            node_start[left + 1] = mid
+            node_count[left + 1] = end - mid
+            stack[top] = left
+            stack[top + 1] = left + 1
+            top += 2
+        return node_min[:used], node_max[:used], node_child[:used], node_start[:used], node_count[:used], order
+
+    @njit(parallel=True, cache=True)
+    def _cast_segments_jit(origins, directions, lengths, v0, e1, e2, triangle_faces,
+                           node_min, node_max, node_child, node_start, node_count, order, hits):
+        # Rays are cast in blocks, so each block allocates its traversal stack once instead of every ray
+        block_size = 256
+        for block in prange((origins.shape[0] + block_size - 1) // block_size):
+            stack = np.empty(64, dtype=np.int64)
+            for i in range(block * block_size, min((block + 1) * block_size, origins.shape[0])):
+                hits[i] = -1
+                if lengths[i] <= 0:
+                    continue
+                ox, oy, oz = origins[i, 0], origins[i, 1], origins[i, 2]
+                dx, dy, dz = directions[i, 0], directions[i, 1], directions[i, 2]
+                ix = 1.0 / dx if dx != 0 else 1e30
+                iy = 1.0 / dy if dy != 0 else 1e30
+                iz = 1.0 / dz if dz != 0 else 1e30
+                nearest = lengths[i]
+                stack[0] = 0
+                top = 1
+                while top > 0:
+                    top -= 1
+                    node = stack[top]
+
+                    # Slab test against the node bounds, pruned by the nearest hit so far
+                    t1 = (node_min[node, 0] - ox) * ix
+                    t2 = (node_max[node, 0] - ox) * ix
+                    near = min(t1, t2)
+                    far = max(t1, t2)
+                    t1 = (node_min[node, 1] - oy) * iy
+                    t2 = (node_max[node, 1] - oy) * iy
+                    near = max(near, min(t1, t2))
+                    far = min(far, max(t1, t2))
+                    t1 = (node_min[node, 2] - oz) * iz
+                    t2 = (node_max[node, 2] - oz) * iz
+                    near = max(near, min(t1, t2))
+                    far = min(far, max(t1, t2))
+                    if far < max(near, 0.0) or near > nearest:
+                        continue
+
+                    if node_child[node] >= 0:
+                        stack[top] = node_child[node]
+                        stack[top + 1] = node_child[node] + 1
+                        top += 2
+                        continue
+
+                    # Moller-Trumbore against every triangle of the leaf
+                    for k in range(node_start[node], node_start[node] + node_count[node]):
+                        tri = order[k]
+                        px = dy * e2[tri, 2] - dz * e2[tri, 1]
+                        py = dz * e2[tri, 0] - dx * e2[tri, 2]
+                        pz = dx * e2[tri, 1] - dy * e2[tri, 0]
+                        det = e1[tri, 0] * px + e1[tri, 1] * py + e1[tri, 2] * pz
+                        if abs(det) < 1e-12:
+                            continue
+                        inv_det = 1.0 / det
+                        tx = ox - v0[tri, 0]
+                        ty = oy - v0[tri, 1]
+                        tz = oz - v0[tri, 2]
+                        # A small tolerance keeps rays through shared edges from slipping between triangles
+                        u = (tx * px + ty * py + tz * pz) * inv_det
+                        if u < -1e-9 or u > 1.0 + 1e-9:
+                            continue
+                        qx = ty * e1[tri, 2] - tz * e1[tri, 1]
+                        qy = tz * e1[tri, 0] - tx * e1[tri, 2]
+                        qz = tx * e1[tri, 1] - ty * e1[tri, 0]
+                        v = (dx * qx + dy * qy + dz * qz) * inv_det
+                        if v < -1e-9 or u + v > 1.0 + 1e-9:
+                            continue
+                        t = (e2[tri, 0] * qx + e2[tri, 1] * qy + e2[tri, 2] * qz) * inv_det
+                        if 0.0 < t < nearest:
+                            nearest = t
+                            hits[i] = triangle_faces[tri]
+
+
+def build_segment_caster(bm, matrix_world, verts_world, triangles, triangle_faces):
+    """
+    Build a function that casts a batch of world-space rays given their origins, directions and lengths in one call.
+    For every ray it returns the index of the first face blocking it, or -1 if nothing does.
+    Given the target face of every ray and the selection, rays towards faces confirmed while the batch
+    is being cast may be skipped and are reported as unobstructed.
+    Also returns whether the function releases the GIL, so that cameras can be cast from several threads
+    """
+    if open3d is not None:
+        scene = open3d.t.geometry.RaycastingScene()
+        if len(triangles):
+            scene.add_triangles(
+                open3d.core.Tensor(verts_world.astype(np.float32)),
+                open3d.core.Tensor(triangles.astype(np.uint32))
+            )
+
+        def cast_segments(origins, directions, lengths, target_faces=None, selected=None):
+            hits = np.full(len(origins), -1)
+            if not len(origins):
+                return hits
+            answer = scene.cast_rays(open3d.core.Tensor(np.hstack((origins, directions)).astype(np.float32)))
+            # Misses come back at an infinite distance, so one comparison with the ray length finds the blocked rays
+            blocked = answer['t_hit'].numpy() < lengths
+            hits[blocked] = triangle_faces[answer['primitive_ids'].numpy()[blocked]]
+            return hits
+
+        # Embree already spreads each batch over every core
+        return cast_segments, False
+
+    if trimesh is not None:
+        tmesh = trimesh.Trimesh(verts_world, triangles, process=False)
+
+        def cast_segments(origins, directions, lengths, target_faces=None, selected=None):
+            hits = np.full(len(origins), -1)
+            locations, ray_indices, triangle_indices = tmesh.ray.intersects_location(
+                origins, directions, multiple_hits=False
+            )
+            # Embree doesn't take a ray length, so discard hits beyond the point
+            hit_distances = np.linalg.norm(locations - origins[ray_indices], axis=1)
+            blocked = hit_distances < lengths[ray_indices]
+            hits[ray_indices[blocked]] = triangle_faces[triangle_indices[blocked]]
+            return hits
+
+        return cast_segments, True
+
+    if njit is not None:
+        # Gather the world-space corners once for both the intersection data and the tree bounds.
+        # The kernel runs in double precision, since float32 rounding would swamp the tolerance
+        # that keeps rays through shared vertices and edges from slipping between triangles
+        corners = verts_world[triangles].astype(np.float64)
+        v0 = np.ascontiguousarray(corners[:, 0])
+        e1 = corners[:, 1] - v0
+        e2 = corners[:, 2] - v0
+        bvh = None
+        if len(triangles):
+            # Node padding is relative to the scene's extent, far above the barycentric tolerance
+            padding = 1e-6 * float(np.ptp(corners.reshape(-1, 3), axis=0).max())
+            bvh = _build_bvh_jit(corners.min(axis=1), corners.max(axis=1), 4, padding)
+
+        def cast_segments(origins, directions, lengths, target_faces=None, selected=None):
+            hits = np.full(len(origins), -1)
+            if bvh is None or not len(origins):
+                return hits
+            _cast_segments_jit(
+                np.ascontiguousarray(origins, dtype=np.float64), np.ascontiguousarray(directions, dtype=np.float64),
+                lengths.astype(np.float64),
+                v0, e1, e2, triangle_faces, *bvh, hits
+            )
+            return hits
+
+        # The kernel already spreads the rays over every core, so cameras stay on the main thread
+        return cast_segments, False
+
+    # The tree is built from the BMesh in the object's local frame, so the rays are moved into it instead
+    bvh = BVHTree.FromBMesh(bm)
+    inverse = np.linalg.inv(np.array(matrix_world))
+    inverse_rotation = inverse[:3, :3].T
+    inverse_translation = inverse[:3, 3]
+
+    def cast_segments(origins, directions, lengths, target_faces=None, selected=None):
+        hits = np.full(len(origins), -1)
+        origins = origins @ inverse_rotation + inverse_translation
+        directions = directions @ inverse_rotation
+        # Scale changes the length of the rays along with their direction
+        scales = np.sqrt(np.einsum('ij,ij->i', directions, directions))
+        directions /= scales[:, np.newaxis]
+        lengths = lengths * scales
+        for i, (origin, direction, length) in enumerate(zip(origins.tolist(), directions.tolist(), lengths.tolist())):
+            # Rays are cast one at a time, so skip targets confirmed by an earlier ray of this batch
+            if target_faces is not None and selected[target_faces[i]]:
+                continue
+            if length > 0:
+                index = bvh.ray_cast(origin, direction, length)[2]
+                if index is not None:
+                    hits[i] = index
+                    # The occluder is visible itself, which lets later rays towards it be skipped
+                    if selected is not None:
+                        selected[index] = True
+        return hits
+
+    return cast_segments, False
+
+
+def cast_face_samples(cast_segments, view_rays, face_indices, eligible, sample_sets, selected):
+    """
+    Ray cast the sample points of the faces from a camera and mark the faces with an unobstructed sample.
+    view_rays builds the camera's rays towards given points.
+    Sample sets are cast one after another, so faces confirmed by an earlier set are not cast again,
+    and a set's points are only tested against the view once its faces are known to need them
+    """
+    for points, sample_in_view, face_elements, element_faces in sample_sets:
+        face_indices = face_indices[~selected[face_indices]]
+        if not len(face_indices):
+            break
+
+        if face_elements is None:
+            sample_ids = face_indices
+        else:
+            # Faces share vertices and edges, so each point is cast once however many faces use it
+            starts, sizes, elements = face_elements
+            sample_ids = np.unique(elements[expand_ranges(face_indices, starts, sizes)[1]])
+        sample_ids = sample_ids[sample_in_view(sample_ids)]
+
+        # Rays going the same way traverse the same tree nodes, so they are cast along a Morton curve.
+        # Perspective rays differ by direction and orthographic rays by origin, so the key spreads both
+        rays = view_rays(points[sample_ids])
+        order = morton_order(rays[0] + rays[1])
+        sample_ids = sample_ids[order]
+        rays = [ray[order] for ray in rays]
+
+        if face_elements is None:
+            hits = cast_segments(*rays, sample_ids, selected)
+        else:
+            hits = cast_segments(*rays)
+        visible = sample_ids[hits < 0]
+        if element_faces is None:
+            selected[visible] = True
+        else:
+            # An unobstructed point in view confirms every eligible face that uses it
+            starts, sizes, faces = element_faces
+            owners = faces[expand_ranges(visible, starts, sizes)[1]]
+            selected[owners[eligible[owners]]] = True
+        # An occluder is the first face struck from the camera, so it is visible itself
+        selected[hits[hits >= 0]] = True
+
+
+def faces_toward_camera(centers, normals, cam_location):
+    """
+    Return a boolean mask of the faces whose front side points towards the camera
+    """
+    return np.einsum('ij,ij->i', centers - cam_location, normals) < 0
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _filter_candidates_jit(centers, normals, selected, cx, cy, cz, dx, dy, dz,
+                               cos_half_fov, backface_culling, eligible, center_in_fov):
+        for i in prange(centers.shape[0]):
+            eligible[i] = False
+            center_in_fov[i] = False
+            if selected[i]:
+                continue
+            vx = centers[i, 0] - cx
+            vy = centers[i, 1] - cy
+            vz = centers[i, 2] - cz
+            if backface_culling and normals[i, 0] * vx + normals[i, 1] * vy + normals[i, 2] * vz >= 0:
+                continue
+            eligible[i] = True
+            dot = vx * dx + vy * dy + vz * dz
+            center_in_fov[i] = dot > 0 and dot * dot > cos_half_fov * cos_half_fov * (vx * vx + vy * vy + vz * vz)
+
+
+def filter_candidates(centers, normals, selected, cam_location, cam_direction, cos_half_fov, backface_culling):
+    """
+    Get a mask of the faces worth testing from a camera and a mask of those whose center is in its view cone
+    """
+    # Threaded sweeps already spread the cameras over the cores, so they use NumPy
+    if can_launch_numba():
+        eligible = np.empty(len(centers), dtype=np.bool_)
+        center_in_fov = np.empty(len(centers), dtype=np.bool_)
+        _filter_candidates_jit(
+            centers, normals, selected,
+            *(float(c) for c in cam_location), *(float(d) for d in cam_direction),
+            cos_half_fov, backface_culling, eligible, center_in_fov
+        )
+        return eligible, center_in_fov
+
+    eligible = ~selected
+    if backface_culling:
+        eligible &= faces_toward_camera(centers, normals, cam_location)
+    return eligible, eligible & points_in_fov(centers, cam_location, cam_direction, cos_half_fov)
+
+
+def filter_ortho_candidates(centers, normals, selected, cam_location, cam_direction, cam_axes, half_size, backface_culling):
+    """
+    Get a mask of the faces worth testing from an orthographic camera and a mask of those whose center is in its view
+    """
+    eligible = ~selected
+    if backface_culling:
+        # Parallel rays all look along the view direction, so facing doesn't depend on the face position
+        eligible &= normals @ cam_direction < 0
+    return eligible, eligible & points_in_ortho_view(centers, cam_location, cam_direction, cam_axes, half_size)
+
+
+def select_visible_faces_multi_cameras(obj, bm, cameras, precision, experimental, sampling_ratio, flatness_angle, backface_culling,
+                                       delete_hidden=False):
+    """
+    Find the faces of the object's BMesh that are visible from any of the cameras, deleting the others if asked.
+    Returns a boolean mask over the faces the BMesh had before
+    """
+    mesh = obj.data
 
     # Calculate number of faces to sample
     total_faces = len(bm.faces)
     
     if experimental:
         sample_count = max(1, int(total_faces * (sampling_ratio / 100)))
-        # Randomly select initial faces to check
-        initial_faces = random.sample(list(bm.faces), sample_count)
+        # Randomly select initial faces to check, drawing indices without building a list of every face
+        initial_faces = np.random.default_rng().choice(total_faces, sample_count, replace=False)
+
+    # World-space sample points are camera independent, so build them once
+    # Low precision only casts face centers, so it skips the edge midpoints
+    verts_world, centers, normals, edge_mids = get_world_space_geometry(obj, precision == 'HIGH')
+    loop_starts, loop_totals, loop_verts, loop_edges = get_face_loop_indices(mesh)
+
+    # Bucket the faces so each camera only scans the cells that reach into its view cone
+    loop_faces = np.repeat(np.arange(total_faces), loop_totals)
+    face_radii = np.zeros(total_faces)
+    if len(loop_verts):
+        face_radii = np.maximum.reduceat(
+            np.linalg.norm(verts_world[loop_verts] - centers[loop_faces], axis=1), loop_starts
+        )
+    cell_order, cell_starts, cell_sizes, cell_centers, cell_radii = bin_faces(centers, face_radii)
+
+    # Faces using each vertex and edge, so one unobstructed sample point confirms all of them.
+    # The experimental expansion also finds linked faces through the vertices
+    if precision == 'HIGH' or experimental:
+        vert_faces = invert_face_elements(loop_verts, loop_faces, len(verts_world))
+    if precision == 'HIGH':
+        edge_faces = invert_face_elements(loop_edges, loop_faces, len(edge_mids))
+
+    # A single ray caster is shared by every camera and sample point.
+    # The triangle buffer is built once, and hits map back to faces through it
+    triangles, triangle_faces = get_loop_triangles(mesh)
+    cast_segments, casts_without_gil = build_segment_caster(
+        bm, obj.matrix_world, verts_world, triangles, triangle_faces
+    )
+
+    # Faces confirmed visible by any camera are never ray cast again
+    selected = np.zeros(total_faces, dtype=bool)
+
+    cam_locations, cam_directions, cos_half_fovs, cam_axes, ortho_half_sizes = get_camera_arrays(cameras)
+    views = range(len(cameras))
+
+    def view_candidates(view, selected):
+        cam_location = cam_locations[view]
+        cam_direction = cam_directions[view]
+        cos_half_fov = cos_half_fovs[view]
+        axes = cam_axes[view]
+        half_size = ortho_half_sizes[view]
+
+        # Orthographic cameras test a view box instead of a cone and cast parallel rays
+        if half_size > 0:
+            in_view = lambda points: points_in_ortho_view(points, cam_location, cam_direction, axes, half_size)
+            view_rays = lambda points: ortho_segment_rays(cam_location, cam_direction, points)
+            visible_cells = cells_in_ortho_view(cell_centers, cell_radii, cam_location, cam_direction, axes, half_size)
+        else:
+            in_view = lambda points: points_in_fov(points, cam_location, cam_direction, cos_half_fov)
+            view_rays = lambda points: segment_rays(cam_location, points)
+            visible_cells = cells_in_view(cell_centers, cell_radii, cam_location, cam_direction, cos_half_fov)
+        face_indices = cell_order[expand_ranges(np.flatnonzero(visible_cells), cell_starts, cell_sizes)[1]]
+
+        # View test for the face centers of this camera in one pass.
+        # A face turned away from the camera can't be seen from it at any sample point
+        eligible = np.zeros(total_faces, dtype=bool)
+        center_in_fov = np.zeros(total_faces, dtype=bool)
+        if half_size > 0:
+            eligible[face_indices], center_in_fov[face_indices] = filter_ortho_candidates(
+                centers[face_indices], normals[face_indices], selected[face_indices],
+                cam_location, cam_direction, axes, half_size, backface_culling
+            )
+        else:
+            eligible[face_indices], center_in_fov[face_indices] = filter_candidates(
+                centers[face_indices], normals[face_indices], selected[face_indices],
+                cam_location, cam_direction, cos_half_fov, backface_culling
+            )
+        # Face centers are cast first, vertices and edge midpoints only for faces still unconfirmed.
+        # Faces with no sample in view cast no rays, so every eligible face is a candidate
+        sample_sets = [(centers, lambda ids: center_in_fov[ids], None, None)]
+        if precision == 'HIGH':
+            sample_sets.append((
+                verts_world, lambda ids: in_view(verts_world[ids]),
+                (loop_starts, loop_totals, loop_verts), vert_faces
+            ))
+            sample_sets.append((
+                edge_mids, lambda ids: in_view(edge_mids[ids]),
+                (loop_starts, loop_totals, loop_edges), edge_faces
+            ))
+        return eligible, sample_sets, view_rays
+
+    if not experimental and views:
+        # Try every face first from the camera that looks at it most directly, so most visible
+        # faces are confirmed by a single ray before the full sweep over all cameras
+        best_facing = np.full(total_faces, -np.inf)
+        preferred_view = np.zeros(total_faces, dtype=np.int32)
+        for view in views:
+            facing = -(normals @ cam_directions[view])
+            better = facing > best_facing
+            best_facing[better] = facing[better]
+            preferred_view[better] = view
+
+        for view in views:
+            eligible, sample_sets, view_rays = view_candidates(view, selected)
+            cast_face_samples(
+                cast_segments, view_rays, np.flatnonzero(eligible & (preferred_view == view)),
+                eligible, sample_sets, selected
+            )
+
+    def sweep_views(views):
+        for view in views:
+            eligible, sample_sets, view_rays = view_candidates(view, selected)
+            cast_face_samples(
+                cast_segments, view_rays, np.flatnonzero(eligible),
+                eligible, sample_sets, selected
+            )
+
+    if experimental:
+        # The faces sharing a vertex with each face are looked up in flat arrays built once
+        face_links = link_faces(loop_starts, loop_totals, loop_verts, vert_faces)
+        min_cos = math.cos(math.radians(flatness_angle))
+
+    def expand_views(views):
+        for view in views:
+            eligible, sample_sets, view_rays = view_candidates(view, selected)
+
+            # Faces to check this iteration (starts with initial sample), cast one wave at a time.
+            # Checked faces are tracked in a mask alongside the selection instead of a set
+            faces_to_check = initial_faces[eligible[initial_faces]]
+            checked = np.zeros(total_faces, dtype=bool)
+
+            while len(faces_to_check):
+                checked[faces_to_check] = True
+                cast_face_samples(
+                    cast_segments, view_rays, faces_to_check,
+                    eligible, sample_sets, selected
+                )
+
+                # Expand to similar faces based on flatness, for the whole wave at once.
+                # Checked, selected and eligible faces are read from the masks instead of the BMesh
+                next_faces = similar_linked_faces(faces_to_check[selected[faces_to_check]], face_links, normals, min_cos)
+                faces_to_check = next_faces[~checked[next_faces] & ~selected[next_faces] & eligible[next_faces]]
+
+    # Cameras are independent queries on the same mesh. When the ray caster releases the GIL,
+    # split them between threads. The threads share the selection, so faces confirmed by one
+    # are masked out of the rays the others cast next, and a stale read only costs a ray
+    process_views = expand_views if experimental else sweep_views
+    workers = min(os.cpu_count() or 1, len(views)) if casts_without_gil else 1
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(process_views, [views[i::workers] for i in range(workers)]))
     else:
-        # Check all faces if not in experimental mode
-        initial_faces = list(bm.faces)
-    
-    for camera in cameras:
-        cam_location = camera.matrix_world.translation
-        cam_direction = camera.matrix_world.to_quaternion() @ Vector((0.0, 0.0, -1.0))
-        cam_fov = camera.data.angle if camera.data.type == 'PERSP' else math.radians(90.0)
+        process_views(views)
 
-        # Faces to check this iteration (starts with initial sample)
-        faces_to_check = set(initial_faces)
-        checked_faces = set()
+    # Hidden faces are stripped from the same BMesh, so the mesh is only written back once
+    if delete_hidden:
+        delete_invisible_faces(bm, selected)
 
-        while faces_to_check:
-            current_face = faces_to_check.pop()
-            
-            # Skip if already checked or selected
-            if current_face in checked_faces or current_face.select:
-                continue
-            
-            checked_faces.add(current_face)
+    return selected
 
-            points_to_check = [obj.matrix_world @ current_face.calc_center_median()]
-            
-            if precision == 'HIGH':
-                points_to_check.extend([obj.matrix_world @ vert.co for vert in current_face.verts])
-                points_to_check.extend([(obj.matrix_world @ edge.verts[0].co + obj.matrix_world @ edge.verts[1].co) / 2 for edge in current_face.edges])
-
-            for point in points_to_check:
-                to_point = (point - cam_location).normalized()
-                angle = to_point.angle(cam_direction)
-
-                if angle < cam_fov / 2:
-                    result = scene.ray_cast(
-                        depsgraph=bpy.context.evaluated_depsgraph_get(),
-                        origin=cam_location,
-                        direction=to_point
-                    )
-
-                    if result[0]:
-                        hit_distance = (result[1] - point).length
-                        if hit_distance < 0.001:
-                            current_face.select = True
-
-                            # Expand to similar faces based on flatness
-                            if experimental:
-                                for neighbor in current_face.verts:
-                                    for linked_face in neighbor.link_faces:
-                                        if (linked_face not in checked_faces and 
-                                            not linked_face.select and 
-                                            are_faces_similar(current_face, linked_face, flatness_angle)):
-                                            faces_to_check.add(linked_face)
-                            break
-
-    bm.to_mesh(mesh)
-    bm.free()
-    bpy.ops.object.mode_set(mode='EDIT')
-    
-    return total_faces
 
+def delete_invisible_faces(bm, visible):
+    """
+    Delete the faces of the BMesh outside the visible mask along with the vertices and edges left without a face
+    """
+    invisible = [face for face, is_visible in zip(bm.faces, visible.tolist()) if not is_visible]
+    bmesh.ops.delete(bm, geom=invisible, context='FACES')
+    bmesh.ops.delete(bm, geom=[vert for vert in bm.verts if not vert.link_faces], context='VERTS')
 
-def delete_invisible_faces():
-    bpy.ops.mesh.hide(unselected=False)
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.delete(type='FACE')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.delete(type='EDGE')
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.delete(type='VERT')
-    bpy.ops.mesh.reveal()
-    bpy.ops.object.mode_set(mode='OBJECT')
+
+def merge_by_distance(bm, visible, distance=0.0001):
+    """
+    Merge the vertices of the BMesh that are closer than the distance.
+    Faces can collapse or be rebuilt while merging, so the visible mask is carried through a face layer
+    and returned for the faces that are left
+    """
+    layer = bm.faces.layers.int.new("hidden_removal_visible")
+    for face, is_visible in zip(bm.faces, visible.tolist()):
+        face[layer] = is_visible
+    bmesh.ops.remove_doubles(bm, verts=bm.verts[:], dist=distance)
+    visible = np.array([face[layer] for face in bm.faces], dtype=bool)
+    bm.faces.layers.int.remove(layer)
+    return visible
+
+
+def write_face_selection(mesh, face_mask):
+    """
+    Select the masked faces of the mesh along with their vertices and edges, deselecting everything else
+    """
+    loop_starts, loop_totals, loop_verts, loop_edges = get_face_loop_indices(mesh)
+    loop_selected = np.repeat(face_mask, loop_totals)
+    vert_mask = np.zeros(len(mesh.vertices), dtype=bool)
+    vert_mask[loop_verts[loop_selected]] = True
+    edge_mask = np.zeros(len(mesh.edges), dtype=bool)
+    edge_mask[loop_edges[loop_selected]] = True
+
+    # Vertices and edges are written too, since edit mode rebuilds face selection from them
+    mesh.polygons.foreach_set("select", face_mask)
+    mesh.edges.foreach_set("select", edge_mask)
+    mesh.vertices.foreach_set("select", vert_mask)
 
 
 def delete_all_cameras():
@@ -244,6 +1009,46 @@ def merge_all_meshes():
     return bpy.context.active_object
 
 
+def process_hidden_geometry(obj, cameras, props):
+    """
+    Select or delete the faces of the object hidden from every camera, merging by distance if asked.
+    The mesh is read into one BMesh and written back once.
+    Returns the number of faces left and the number the mesh had before
+    """
+    # The BMesh is read from the mesh data, which is only current outside of edit mode
+    if obj.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    visible = select_visible_faces_multi_cameras(
+        obj,
+        bm,
+        cameras,
+        props.precision_mode,
+        props.experimental,
+        props.sampling_ratio,
+        props.flatness_angle,
+        props.backface_culling,
+        props.delete_select_mode == 'DELETE'
+    )
+    total_faces = len(visible)
+
+    # Only visible faces are left after deleting, so they are all selected
+    if props.delete_select_mode == 'DELETE':
+        visible = np.ones(len(bm.faces), dtype=bool)
+
+    # Merge by distance if option is checked
+    if props.merge_by_distance:
+        visible = merge_by_distance(bm, visible)
+
+    bm.to_mesh(obj.data)
+    bm.free()
+    write_face_selection(obj.data, visible)
+    obj.data.update()
+
+    return len(obj.data.polygons), total_faces
+
+
 class HiddenRemovalProperties(PropertyGroup):
     rows: IntProperty(
         name="Number of Rows",
@@ -289,6 +1094,32 @@ class HiddenRemovalProperties(PropertyGroup):
         default='HIGH',
     )
     
+    camera_distribution: EnumProperty(
+        name="Distribution",
+        description="Choose how the cameras are placed around the object",
+        items=[
+            ('RINGS', "Splines", "Place the cameras along vertical splines"),
+            ('UNIFORM', "Uniform", "Place Rows x Cameras per Row cameras at uniformly random points on the sphere"),
+        ],
+        default='RINGS',
+    )
+
+    camera_type: EnumProperty(
+        name="Projection",
+        description="Choose the projection of the created cameras",
+        items=[
+            ('PERSP', "Perspective", "Cast rays from each camera's location"),
+            ('ORTHO', "Orthographic", "Cast parallel rays along each camera's view direction"),
+        ],
+        default='PERSP',
+    )
+
+    backface_culling: BoolProperty(
+        name="Backface Culling",
+        description="Skip faces that point away from a camera. Disable for open or double-sided meshes",
+        default=True,
+    )
+
     keep_cameras: BoolProperty(
         name="Keep Cameras",
         description="Keep the created cameras in a 'Cameras' collection",
@@ -362,34 +1193,13 @@ class OBJECT_OT_hidden_geometry_removal(Operator):
             props.rows, 
             props.cameras_per_row, 
             props.sphere_radius, 
-            props.keep_cameras
+            props.keep_cameras,
+            props.camera_type,
+            props.camera_distribution
         )
         
         # Process faces and get total face count
-        total_faces = select_visible_faces_multi_cameras(
-            obj, 
-            cameras, 
-            props.precision_mode,
-            props.experimental,
-            props.sampling_ratio,
-            props.flatness_angle
-        )
-
-        if props.delete_select_mode == 'DELETE':
-            delete_invisible_faces()
-        
-        # Merge by distance if option is checked
-        if props.merge_by_distance:
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.remove_doubles(threshold=0.0001)
-            bpy.ops.object.mode_set(mode='OBJECT')
-        
-        # Count remaining faces
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        visible_faces = len(obj.data.polygons)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        visible_faces, total_faces = process_hidden_geometry(obj, cameras, props)
 
         # Only delete cameras if we're not keeping them
         if not props.keep_cameras:
@@ -448,6 +1258,8 @@ class VIEW3D_PT_hidden_geometry_removal(Panel):
         col = box.column()
         col.label(text="Should be larger than object dimensions")
         col.prop(props, "sphere_radius")
+        col.prop(props, "camera_distribution")
+        col.prop(props, "camera_type")
         col.separator()
 
         # Delete/Select Mode section
@@ -458,6 +1270,7 @@ class VIEW3D_PT_hidden_geometry_removal(Panel):
         # Precision Mode section
         col = box.column()
         col.prop(props, "precision_mode")
+        col.prop(props, "backface_culling")
         col.separator()
         
         # Camera visibility option